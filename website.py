@@ -1,11 +1,7 @@
+import os
+import tempfile
 import streamlit as st
 import numpy as np
-import matplotlib.pyplot as plt
-import matplotlib.animation as animation
-from matplotlib.patches import Circle, Ellipse, Rectangle, FancyArrowPatch
-from matplotlib.lines import Line2D
-from matplotlib.gridspec import GridSpec
-import streamlit.components.v1 as components
 
 # --- PAGE CONFIGURATION ---
 st.set_page_config(
@@ -15,14 +11,52 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# --- UTILITY: RENDER MATPLOTLIB ANIMATION IN STREAMLIT ---
-def render_animation(anim):
+# --- UTILITY: ENCODE MATPLOTLIB ANIMATION FOR STREAMLIT ---
+RENDER_MESSAGE = "Rendering Simulation... (This may take a moment)"
+
+def encode_animation(anim, fig):
+    """
+    Encodes a matplotlib animation to H.264 and returns the mp4 bytes.
+    The figure is closed afterwards; only the cached bytes are kept.
+    """
+    import matplotlib.pyplot as plt
+
+    # ffmpeg needs a real path, so encode into a temporary file
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "simulation.mp4")
+            anim.save(path, writer='ffmpeg', codec='libx264', bitrate=1800,
+                      extra_args=['-pix_fmt', 'yuv420p', '-preset', 'veryfast'],
+                      savefig_kwargs={'facecolor': 'black'})
+            with open(path, 'rb') as f:
+                return f.read()
+    finally:
+        plt.close(fig)
+
+# --- KERNEL: CASIMIR STANDING WAVES ---
+def _casimir_modes(x_in, d, phase, out):
+    """
+    Fills out[i] with the (i+1)-th standing-wave mode between the plates
+    """
+    c = np.cos(phase)
+    for i in range(out.shape[0]):
+        k = (i+1) * np.pi / (d + 2.0)
+        for j in range(x_in.shape[0]):
+            out[i, j] = 0.5 * np.sin(k * (x_in[j] + 2.0)) * c
+
+@st.cache_resource
+def get_casimir_kernel():
     """
-    Converts a matplotlib animation to an interactive HTML component
+    Compiles the Casimir kernel once per server process.
+    The explicit signature compiles eagerly, and cache=True lets later
+    processes load the machine code from disk instead of recompiling.
     """
-    with st.spinner("Rendering Simulation... (This may take a moment)"):
-        js_html = anim.to_jshtml()
-        components.html(js_html, height=700, scrolling=False)
+    from numba import njit
+
+    return njit('void(f8[:], f8, f8, f8[:, :])', cache=True, fastmath=True)(_casimir_modes)
+
+# Warm up at import so the first visitor doesn't pay for compilation
+get_casimir_kernel()
 
 # ==========================================
 # 1. HOMEPAGE
@@ -51,9 +85,11 @@ def show_home():
 # ==========================================
 # 2. GRAVITATIONAL LENSING
 # ==========================================
-def show_lensing():
-    st.header("🔭 Gravitational Lensing")
-    st.markdown("**Concept:** Gravity bends light. A massive object (like a galaxy cluster) acts as a lens, distorting the image of stars behind it.")
+@st.cache_data(show_spinner=RENDER_MESSAGE)
+def _build_lensing_mp4():
+    import matplotlib.pyplot as plt
+    import matplotlib.animation as animation
+    from matplotlib.patches import Circle, Ellipse
 
     plt.style.use('dark_background')
     fig, ax = plt.subplots(figsize=(10, 5))
@@ -76,8 +112,7 @@ def show_lensing():
     # Lines
     beam_top, = ax.plot([], [], color='white', linewidth=2, alpha=0.8)
     beam_bottom, = ax.plot([], [], color='white', linewidth=2, alpha=0.8)
-    app_top, = ax.plot([], [], color='red', linestyle='--', alpha=0)
-    app_bot, = ax.plot([], [], color='red', linestyle='--', alpha=0)
+    app_lines = [] # Apparent-position lines, created once the beams arrive
     img_top = Circle((-8, 0), 0.1, color='red', alpha=0)
     img_bot = Circle((-8, 0), 0.1, color='red', alpha=0)
     ax.add_patch(img_top)
@@ -85,27 +120,30 @@ def show_lensing():
     
     txt = ax.text(-8, 3.5, "", color='red', ha='center')
 
-    def get_path(t, sign):
-        x = 8 * (1 - 2*t)
-        y = sign * 2.5 * np.sin(t * np.pi)
-        return x, y
+    # Full beam path, sliced up to the current frame
+    TP = np.linspace(0, 1, 51)
+    X_PATH = 8 * (1 - 2*TP)
+    Y_PATH = 2.5 * np.sin(TP * np.pi)
+    # Dashed-line points for every progress step: (step, point)
+    P = np.linspace(0, 1, 31).reshape(-1, 1)
+    PTS = np.linspace(0, 1, 10).reshape(1, -1)
+    DASH_X = -8 + 16*P*PTS
+    DASH_Y_TOP = 5*P*PTS
+    DASH_Y_BOT = -5*P*PTS
 
     def animate(frame):
         if frame <= 50:
-            t = frame / 50.0
-            tp = np.linspace(0, t, frame+1)
-            beam_top.set_data(*get_path(tp, 1))
-            beam_bottom.set_data(*get_path(tp, -1))
+            beam_top.set_data(X_PATH[:frame+1], Y_PATH[:frame+1])
+            beam_bottom.set_data(X_PATH[:frame+1], -Y_PATH[:frame+1])
         else:
             # Dashed lines
-            prog = min(1, (frame-50)/30.0)
-            dash_x = np.linspace(-8, -8 + 16*prog, 10)
-            dash_y_top = np.linspace(0, 5*prog, 10)
-            dash_y_bot = np.linspace(0, -5*prog, 10)
-            app_top.set_data(dash_x, dash_y_top)
-            app_bot.set_data(dash_x, dash_y_bot)
-            app_top.set_alpha(0.5)
-            app_bot.set_alpha(0.5)
+            if not app_lines:
+                app_lines.extend(ax.plot([], [], color='red', linestyle='--', alpha=0.5)[0] for _ in range(2))
+            app_top, app_bot = app_lines
+            k = min(frame - 50, 30)
+            prog = k / 30.0
+            app_top.set_data(DASH_X[k], DASH_Y_TOP[k])
+            app_bot.set_data(DASH_X[k], DASH_Y_BOT[k])
             
             if prog > 0.1:
                 img_top.center = (-8+16*prog, 5*prog)
@@ -114,17 +152,24 @@ def show_lensing():
                 img_bot.set_alpha(1)
                 txt.set_text("Apparent Position\n(Einstein Ring)")
                 
-        return beam_top, beam_bottom, app_top, app_bot, img_top, img_bot, txt
+        return (beam_top, beam_bottom, *app_lines, img_top, img_bot, txt)
 
     ani = animation.FuncAnimation(fig, animate, frames=100, interval=40, blit=True)
-    render_animation(ani)
+    return encode_animation(ani, fig)
+
+def show_lensing():
+    st.header("🔭 Gravitational Lensing")
+    st.markdown("**Concept:** Gravity bends light. A massive object (like a galaxy cluster) acts as a lens, distorting the image of stars behind it.")
+    st.video(_build_lensing_mp4(), loop=True)
 
 # ==========================================
 # 3. MICHELSON INTERFEROMETER
 # ==========================================
-def show_interferometer():
-    st.header("📏 Michelson Interferometer")
-    st.markdown("**Concept:** Splitting a light beam and recombining it creates interference patterns. Moving a mirror by a tiny fraction of a wavelength shifts the pattern.")
+@st.cache_data(show_spinner=RENDER_MESSAGE)
+def _build_interferometer_mp4(resolution=64):
+    import matplotlib.pyplot as plt
+    import matplotlib.animation as animation
+    from matplotlib.patches import Rectangle
 
     plt.style.use('dark_background')
     fig = plt.figure(figsize=(12, 6))
@@ -144,11 +189,16 @@ def show_interferometer():
     
     # View Setup
     ax_view.axis('off'); ax_view.set_title("Detector View")
-    x = np.linspace(-10, 10, 100)
+    x = np.linspace(-10, 10, resolution, dtype=np.float32)
     X, Y = np.meshgrid(x, x)
-    R = np.sqrt(X**2 + Y**2)
+    R = np.sqrt(X*X + Y*Y)
     img = ax_view.imshow(np.zeros_like(R), cmap='hot', vmin=0, vmax=1)
 
+    # Frame-invariant phase term + reusable output buffer (all float32)
+    PHASE0 = np.float32(0.5) * R * R
+    TWO_PI = np.float32(2*np.pi)
+    Z = np.empty_like(PHASE0)
+
     def animate(frame):
         # Mirror Logic
         mx = 4.8 + 0.8 * np.sin(frame * 0.1)
@@ -164,20 +214,30 @@ def show_interferometer():
         
         # Interference Logic
         delta_L = 2 * (mx - 4.8)
-        Z = np.cos(0.5 * R**2 + 2*np.pi*delta_L)**2
+        np.add(PHASE0, TWO_PI * np.float32(delta_L), out=Z)
+        np.cos(Z, out=Z)
+        np.multiply(Z, Z, out=Z)
         img.set_data(Z)
         return beams + [mirror_move, img]
 
     ani = animation.FuncAnimation(fig, animate, frames=100, interval=50, blit=True)
-    render_animation(ani)
+    return encode_animation(ani, fig)
+
+def show_interferometer():
+    st.header("📏 Michelson Interferometer")
+    st.markdown("**Concept:** Splitting a light beam and recombining it creates interference patterns. Moving a mirror by a tiny fraction of a wavelength shifts the pattern.")
+    resolution = st.sidebar.slider("Detector resolution", 32, 128, 64, step=16)
+    st.video(_build_interferometer_mp4(resolution), loop=True)
 
 # ==========================================
 # 4. COUPLED PENDULUMS
 # ==========================================
-def show_pendulum():
-    st.header("⏰ Coupled Pendulums")
-    st.markdown("**Concept:** Energy transfer between two oscillators connected by a spring creates 'beats'.")
-    
+@st.cache_data(show_spinner=RENDER_MESSAGE)
+def _build_pendulum_mp4():
+    import matplotlib.pyplot as plt
+    import matplotlib.animation as animation
+    from matplotlib.patches import Circle
+
     plt.style.use('dark_background')
     fig, axes = plt.subplots(1, 3, figsize=(12, 4))
     
@@ -204,30 +264,23 @@ def show_pendulum():
 
     t = np.linspace(0, 20, 200)
     w1, w2 = 3.0, 3.5
+    COS_W1 = np.cos(w1 * t)
+    COS_W2 = np.cos(w2 * t)
+    PIV = np.array([-0.4, 0.4])
     
     def animate(i):
-        # 1. In Phase
-        th1 = 0.2 * np.cos(w1 * t[i])
-        th2 = 0.2 * np.cos(w1 * t[i])
-        coords1 = (th1, th2)
-        
-        # 2. Out Phase
-        th3 = 0.2 * np.cos(w2 * t[i])
-        th4 = -0.2 * np.cos(w2 * t[i])
-        coords2 = (th3, th4)
-        
-        # 3. Beats
-        th5 = 0.1 * np.cos(w1 * t[i]) + 0.1 * np.cos(w2 * t[i])
-        th6 = 0.1 * np.cos(w1 * t[i]) - 0.1 * np.cos(w2 * t[i])
-        coords3 = (th5, th6)
-        
-        all_coords = [coords1, coords2, coords3]
+        c1, c2 = COS_W1[i], COS_W2[i]
+        # Rows: In Phase, Out Phase, Beats (Superposition)
+        theta = np.array([[0.2*c1, 0.2*c1],
+                          [0.2*c2, -0.2*c2],
+                          [0.1*c1 + 0.1*c2, 0.1*c1 - 0.1*c2]])
+        X = PIV + np.sin(theta)
+        Y = -np.cos(theta)
         
         artists = []
         for j in range(3):
-            a, b = all_coords[j]
-            x1, y1 = -0.4 + np.sin(a), -np.cos(a)
-            x2, y2 = 0.4 + np.sin(b), -np.cos(b)
+            x1, x2 = X[j]
+            y1, y2 = Y[j]
             
             lines_rods[j][0].set_data([-0.4, x1], [0, y1])
             lines_rods[j][1].set_data([0.4, x2], [0, y2])
@@ -240,14 +293,21 @@ def show_pendulum():
         return artists
 
     ani = animation.FuncAnimation(fig, animate, frames=200, interval=30, blit=True)
-    render_animation(ani)
+    return encode_animation(ani, fig)
+
+def show_pendulum():
+    st.header("⏰ Coupled Pendulums")
+    st.markdown("**Concept:** Energy transfer between two oscillators connected by a spring creates 'beats'.")
+    st.video(_build_pendulum_mp4(), loop=True)
 
 # ==========================================
 # 5. DOUBLE SLIT
 # ==========================================
-def show_doubleslit():
-    st.header("🌊 Young's Double Slit (Electrons)")
-    st.markdown("**Concept:** Electrons arrive as particles (discrete dots), but their probability distribution forms a wave interference pattern.")
+@st.cache_data(show_spinner=RENDER_MESSAGE)
+def _build_doubleslit_mp4():
+    import matplotlib.pyplot as plt
+    import matplotlib.animation as animation
+    from matplotlib.gridspec import GridSpec
 
     plt.style.use('dark_background')
     fig = plt.figure(figsize=(10, 6))
@@ -265,7 +325,7 @@ def show_doubleslit():
     ax_bot = fig.add_subplot(gs[1, 0])
     ax_bot.set_title("Detector View"); ax_bot.set_facecolor('black')
     ax_bot.set_xlim(-0.5, 0.5); ax_bot.set_ylim(-1, 1); ax_bot.axis('off')
-    impacts, = ax_bot.plot([], [], 'o', color='lime', ms=2, alpha=0.6)
+    impacts = ax_bot.scatter([], [], s=4, c='lime', alpha=0.6)
     
     ax_graph = fig.add_subplot(gs[1, 1])
     ax_graph.set_title("Accumulation vs Theory")
@@ -279,49 +339,67 @@ def show_doubleslit():
     
     bins = np.linspace(-1, 1, 30)
     bars = ax_graph.barh(bins[:-1], np.zeros(29), height=np.diff(bins), color='cyan', alpha=0.6)
+    counts = np.zeros(len(bins) - 1, dtype=np.int32)
     
-    landed_y = []
+    # Inverse-CDF table for sampling landing positions
+    y_grid = np.linspace(-1, 1, 4096)
+    pdf = np.cos(10*y_grid)**2 * np.sinc(2*y_grid)**2
+    cdf = np.cumsum(pdf)
+    cdf /= cdf[-1]
+
+    # Pre-draw every landing (one per 5 frames) as (x jitter, y) pairs
+    rng = np.random.default_rng(0) # Seeded so the cached clip is reproducible
+    n_frames = 100
+    n_landings = n_frames // 5
+    OFFSETS = np.column_stack((rng.normal(0, 0.1, n_landings),
+                               y_grid[np.searchsorted(cdf, rng.random(n_landings))]))
+    # Same binning as np.histogram (last bin closed on the right)
+    BIN_IDX = np.clip(np.searchsorted(bins, OFFSETS[:, 1], side='right') - 1, 0, len(counts) - 1)
+    landed = 0
 
     def animate(frame):
-        # Determine target
-        if frame % 5 == 0:
-            # Rejection sampling for target
-            while True:
-                r_y = np.random.uniform(-1, 1)
-                prob = (np.cos(10*r_y)**2 * np.sinc(2*r_y)**2)
-                if np.random.random() < prob:
-                    landed_y.append(r_y)
-                    break
+        nonlocal landed
+        # Land the next electron (guarded: FuncAnimation draws frame 0 twice)
+        if frame % 5 == 0 and landed == frame // 5:
+            counts[BIN_IDX[landed]] += 1
+            landed += 1
         
         # Flight animation (simplified)
         sub = frame % 5
         prog = sub / 5.0
         # Check if we have a target
-        if landed_y:
-            target = landed_y[-1]
+        if landed:
+            target = OFFSETS[landed - 1, 1]
             dot.set_data([-1.5 + 4*prog], [target * prog])
         
         # Impacts
-        impacts.set_data(np.random.normal(0, 0.1, len(landed_y)), landed_y)
+        impacts.set_offsets(OFFSETS[:landed])
         
         # Histogram
-        hist, _ = np.histogram(landed_y, bins=bins)
-        if len(landed_y) > 0:
-            hist = hist / max(hist) if max(hist) > 0 else hist
-            for bar, h in zip(bars, hist):
+        m = counts.max()
+        if m > 0:
+            for bar, h in zip(bars, counts / m):
                 bar.set_width(h)
                 
         return [dot, impacts] + list(bars)
 
-    ani = animation.FuncAnimation(fig, animate, frames=100, interval=20, blit=False)
-    render_animation(ani)
+    ani = animation.FuncAnimation(fig, animate, frames=n_frames, interval=20, blit=False)
+    return encode_animation(ani, fig)
+
+def show_doubleslit():
+    st.header("🌊 Young's Double Slit (Electrons)")
+    st.markdown("**Concept:** Electrons arrive as particles (discrete dots), but their probability distribution forms a wave interference pattern.")
+    st.video(_build_doubleslit_mp4(), loop=True)
 
 # ==========================================
 # 6. CASIMIR EFFECT
 # ==========================================
-def show_casimir():
-    st.header("👻 The Casimir Effect")
-    st.markdown("**Concept:** Vacuum fluctuations are suppressed between two plates. The higher pressure of 'virtual particles' outside pushes the plates together.")
+@st.cache_data(show_spinner=RENDER_MESSAGE)
+def _build_casimir_mp4():
+    import matplotlib.pyplot as plt
+    import matplotlib.animation as animation
+    from matplotlib.patches import Rectangle, FancyArrowPatch
+    from matplotlib.collections import LineCollection
 
     plt.style.use('dark_background')
     fig, ax = plt.subplots(figsize=(10, 5))
@@ -331,13 +409,17 @@ def show_casimir():
     plate_R = Rectangle((1.9, -2), 0.2, 4, color='silver')
     ax.add_patch(plate_L); ax.add_patch(plate_R)
     
-    lines_out = [ax.plot([], [], 'c-', alpha=0.2)[0] for _ in range(20)]
-    lines_in = [ax.plot([], [], 'm-', alpha=0.6)[0] for _ in range(5)]
+    lines_in = LineCollection([], colors='m', alpha=0.6, capstyle='projecting')
+    ax.add_collection(lines_in)
     
     arr_L = FancyArrowPatch((-3, 0), (-2.2, 0), mutation_scale=20, color='red')
     arr_R = FancyArrowPatch((3, 0), (2.2, 0), mutation_scale=20, color='red')
     ax.add_patch(arr_L); ax.add_patch(arr_R)
 
+    # (mode, point, xy) segments for the 5 standing waves between the plates
+    SEGS = np.empty((5, 50, 2))
+    casimir_modes = get_casimir_kernel()
+
     def animate(frame):
         d = 2.0 * (1 - frame/100.0) + 0.5
         plate_R.set_x(d)
@@ -347,21 +429,28 @@ def show_casimir():
         arr_R.set_positions((d+0.2+d*0.5, 0), (d+0.2, 0))
         
         x_in = np.linspace(-2, d, 50)
-        for i, line in enumerate(lines_in):
-            y = 0.5 * np.sin((i+1)*np.pi * (x_in + 2)/(d+2)) * np.cos(frame*0.2)
-            line.set_data(x_in, y)
+        SEGS[:, :, 0] = x_in
+        casimir_modes(x_in, d, frame*0.2, SEGS[:, :, 1])
+        lines_in.set_segments(SEGS)
             
-        return [plate_R, arr_L, arr_R] + lines_in
+        return [plate_R, arr_L, arr_R, lines_in]
 
     ani = animation.FuncAnimation(fig, animate, frames=80, interval=40, blit=True)
-    render_animation(ani)
+    return encode_animation(ani, fig)
+
+def show_casimir():
+    st.header("👻 The Casimir Effect")
+    st.markdown("**Concept:** Vacuum fluctuations are suppressed between two plates. The higher pressure of 'virtual particles' outside pushes the plates together.")
+    st.video(_build_casimir_mp4(), loop=True)
 
 # ==========================================
 # 7. HAWKING RADIATION
 # ==========================================
-def show_hawking():
-    st.header("🕳️ Hawking Radiation")
-    st.markdown("**Concept:** Virtual particle pairs form near the event horizon. One falls in (negative energy), one escapes (radiation). The black hole loses mass.")
+@st.cache_data(show_spinner=RENDER_MESSAGE)
+def _build_hawking_mp4():
+    import matplotlib.pyplot as plt
+    import matplotlib.animation as animation
+    from matplotlib.patches import Circle
 
     plt.style.use('dark_background')
     fig, ax = plt.subplots(figsize=(8, 8))
@@ -375,32 +464,45 @@ def show_hawking():
     p1, = ax.plot([], [], 'co', ms=5) # Escape
     p2, = ax.plot([], [], 'ro', ms=5) # Fall
     
+    # Length-1 scratch buffers reused for every set_data call
+    X1 = np.empty(1); Y1 = np.empty(1)
+    X2 = np.empty(1); Y2 = np.zeros(1)
+    
     def animate(frame):
         cycle = frame % 40
         if cycle < 10: # Spawning
-            p1.set_data([1.1], [0])
-            p2.set_data([0.9], [0])
+            X1[0] = 1.1; Y1[0] = 0
+            X2[0] = 0.9
             p1.set_alpha(cycle/10)
             p2.set_alpha(cycle/10)
         else:
             # Moving
             t = (cycle - 10) / 30.0
-            p1.set_data([1.1 + t*1.5], [t*0.5]) # Fly away
-            p2.set_data([0.9 - t*0.9], [0]) # Fall in
+            X1[0] = 1.1 + t*1.5; Y1[0] = t*0.5 # Fly away
+            X2[0] = 0.9 - t*0.9 # Fall in
             p2.set_alpha(1 - t) # Fade
+        p1.set_data(X1, Y1)
+        p2.set_data(X2, Y2)
             
         return p1, p2
 
     ani = animation.FuncAnimation(fig, animate, frames=120, interval=30, blit=True)
-    render_animation(ani)
+    return encode_animation(ani, fig)
+
+def show_hawking():
+    st.header("🕳️ Hawking Radiation")
+    st.markdown("**Concept:** Virtual particle pairs form near the event horizon. One falls in (negative energy), one escapes (radiation). The black hole loses mass.")
+    st.video(_build_hawking_mp4(), loop=True)
 
 # ==========================================
 # 8. VACUUM DECAY
 # ==========================================
-def show_vacuum():
-    st.header("💥 Vacuum Decay")
-    st.markdown("**Concept:** If the Higgs field is in a 'false vacuum', it can tunnel through an energy barrier. This creates a bubble of 'new physics' that expands at light speed.")
-    
+@st.cache_data(show_spinner=RENDER_MESSAGE)
+def _build_vacuum_mp4():
+    import matplotlib.pyplot as plt
+    import matplotlib.animation as animation
+    from matplotlib.patches import Circle
+
     plt.style.use('dark_background')
     fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(12, 6))
     
@@ -413,30 +515,32 @@ def show_vacuum():
     
     # Space
     ax2.axis('off'); ax2.set_xlim(-10, 10); ax2.set_ylim(-10, 10)
-    stars = ax2.scatter(np.random.uniform(-10,10,100), np.random.uniform(-10,10,100), c='w', s=5)
+    rng = np.random.default_rng(0)
+    stars = ax2.scatter(rng.uniform(-10,10,100), rng.uniform(-10,10,100), c='w', s=5)
     bubble = Circle((0,0), 0, color='magenta', alpha=0.5)
     ax2.add_patch(bubble)
     
+    # Per-frame state: false vacuum (<30), tunneling (<50), true vacuum
+    n_frames = 100
+    frames = np.arange(n_frames)
+    BALL_X = np.where(frames < 30, 0.0, np.where(frames < 50, 2.5 * (frames-30)/20.0, 2.7))
+    BALL_Y = np.where(frames < 30, 0.0, np.where(frames < 50, 1.5, -1.0))
+    COLORS = ['c']*30 + ['yellow']*20 + ['magenta']*(n_frames - 50)
+    BUBBLE_R = np.maximum(0, (frames - 50) * 0.3)
+    
     def animate(frame):
-        # 1. Tunneling
-        if frame < 30:
-            ball.set_data([0], [0]) # False vacuum
-        elif frame < 50:
-            ball.set_data([2.5 * (frame-30)/20.0], [1.5]) # Tunneling
-            ball.set_color('yellow')
-        else:
-            ball.set_data([2.7], [-1]) # True vacuum
-            ball.set_color('magenta')
-            
-        # 2. Bubble
-        if frame > 50:
-            r = (frame - 50) * 0.3
-            bubble.set_radius(r)
-            
+        ball.set_data(BALL_X[frame:frame+1], BALL_Y[frame:frame+1])
+        ball.set_color(COLORS[frame])
+        bubble.set_radius(BUBBLE_R[frame])
         return ball, bubble
 
-    ani = animation.FuncAnimation(fig, animate, frames=100, interval=40, blit=True)
-    render_animation(ani)
+    ani = animation.FuncAnimation(fig, animate, frames=n_frames, interval=40, blit=True)
+    return encode_animation(ani, fig)
+
+def show_vacuum():
+    st.header("💥 Vacuum Decay")
+    st.markdown("**Concept:** If the Higgs field is in a 'false vacuum', it can tunnel through an energy barrier. This creates a bubble of 'new physics' that expands at light speed.")
+    st.video(_build_vacuum_mp4(), loop=True)
 
 # ==========================================
 # NAVIGATION LOGIC